@@ -6,6 +6,7 @@ Handles database connections and operations for all scrapers
 import os
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 from pymongo import MongoClient
@@ -23,7 +24,8 @@ class MongoDBManager:
     def __init__(self, 
                  connection_string: str = None,
                  database_name: str = "aiqod-dev",
-                 max_pool_size: int = 100):
+                 max_pool_size: int = 100,
+                 min_pool_size: int = 20):
         """
         Initialize MongoDB connection
         
@@ -31,10 +33,12 @@ class MongoDBManager:
             connection_string: MongoDB connection string (defaults to localhost)
             database_name: Name of the database
             max_pool_size: Maximum connection pool size
+            min_pool_size: Connections kept open so scrapers sharing this client skip handshakes
         """
         self.connection_string = connection_string or os.getenv('MONGODB_URI', 'mongodb://localhost:27017/')
         self.database_name = database_name
         self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
         self.client = None
         self.db = None
         
@@ -56,6 +60,10 @@ class MongoDBManager:
             self.client = MongoClient(
                 self.connection_string,
                 maxPoolSize=self.max_pool_size,
+                minPoolSize=self.min_pool_size,
+                maxIdleTimeMS=60000,
+                retryWrites=True,
+                compressors='zstd',
                 serverSelectionTimeoutMS=5000
             )
             
@@ -72,6 +80,34 @@ class MongoDBManager:
             logger.error(f"❌ Failed to connect to MongoDB: {e}")
             raise
     
+    def warm_up_pool(self, connections: int = None) -> int:
+        """
+        Open pooled connections ahead of the first batch of writes
+        
+        Args:
+            connections: Number of concurrent pings to issue (defaults to min_pool_size)
+            
+        Returns:
+            Number of pings that succeeded
+        """
+        connections = min(connections or self.min_pool_size, self.max_pool_size)
+        if not self.client or connections <= 0:
+            return 0
+        
+        def ping(_):
+            try:
+                self.client.admin.command('ping')
+                return True
+            except Exception:
+                return False
+        
+        # Concurrent pings each check out their own socket, filling the pool
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            warmed = sum(executor.map(ping, range(connections)))
+        
+        logger.info(f"🔥 MongoDB connection pool warmed: {warmed}/{connections} connections")
+        return warmed
+    
     def _create_indexes(self):
         """Create indexes for better query performance
         
@@ -607,11 +643,11 @@ class MongoDBManager:
             ]
             
             stats = {}
+            total_count = collection.estimated_document_count()
             
             for field in additional_fields:
                 # Count non-null values
                 non_null_count = collection.count_documents({field: {'$ne': None, '$ne': ''}})
-                total_count = collection.count_documents({})
                 
                 # Get distinct values for categorical fields
                 distinct_values = []
@@ -666,7 +702,7 @@ class MongoDBManager:
         try:
             stats = {}
             for source, collection_name in self.collections.items():
-                count = self.db[collection_name].count_documents({})
+                count = self.db[collection_name].estimated_document_count()
                 stats[source] = count
             
             stats['total_leads'] = sum(stats.values())
@@ -31,12 +31,6 @@ class MongoDBLeadProcessor:
         self.mongodb_manager = mongodb_manager
         
         try:
-            self.client = MongoClient(self.mongodb_uri)
-            self.db = self.client[self.database_name]
-            # Test connection
-            self.client.admin.command('ismaster')
-            logger.info(f"Connected to MongoDB: {self.database_name}")
-            
             # Initialize unified MongoDB manager if not provided
             if not self.mongodb_manager:
                 try:
@@ -45,6 +39,16 @@ class MongoDBLeadProcessor:
                 except Exception as e:
                     logger.warning(f"⚠️ Failed to initialize unified MongoDB manager: {e}")
                     self.mongodb_manager = None
+            
+            # Reuse the shared manager's connection pool when it points at the same server
+            self._owns_client = not (
+                self.mongodb_manager and self.mongodb_manager.connection_string == self.mongodb_uri
+            )
+            self.client = MongoClient(self.mongodb_uri) if self._owns_client else self.mongodb_manager.client
+            self.db = self.client[self.database_name]
+            # Test connection
+            self.client.admin.command('ismaster')
+            logger.info(f"Connected to MongoDB: {self.database_name}")
                 
         except PyMongoError as e:
             logger.error(f"Failed to connect to MongoDB: {str(e)}")
@@ -602,8 +606,8 @@ class MongoDBLeadProcessor:
             source_coll = self.db[self.source_collection]
             target_coll = self.db[self.target_collection]
             
-            total_web_leads = source_coll.count_documents({})
-            total_extracted_leads = target_coll.count_documents({})
+            total_web_leads = source_coll.estimated_document_count()
+            total_extracted_leads = target_coll.estimated_document_count()
             
             # Get some sample stats
             unique_companies = len(target_coll.distinct('Company Name'))
@@ -644,7 +648,7 @@ class MongoDBLeadProcessor:
         """
         Close MongoDB connection
         """
-        if hasattr(self, 'client'):
+        if hasattr(self, 'client') and self._owns_client:
             self.client.close()
             logger.info("MongoDB connection closed")
 
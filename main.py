@@ -12,9 +12,11 @@ Flow:
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import sys
+import threading
 import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -22,17 +24,17 @@ from urllib.parse import urlparse
 import logging
 import re
 import random
+import orjson
+from aiolimiter import AsyncLimiter
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import scrapers
-from web_url_scraper.main import main as web_url_scraper_main, initialize_application
-from web_url_scraper.database_service import get_urls_by_type, get_url_type_statistics, get_urls_by_type_and_icp
-from web_scraper.main_app import WebScraperOrchestrator
-from instagram_scraper.main_optimized import OptimizedInstagramScraper, ScrapingConfig
-from linkedin_scraper.main import LinkedInScraperMain, OptimizedLinkedInScraper
-from yt_scraper.main import YouTubeScraperInterface
-from facebook_scraper.main_optimized import OptimizedFacebookScraper, FacebookScrapingConfig
+from web_url_scraper.main import main_async as web_url_scraper_main_async, initialize_application
+from web_url_scraper.database_service import get_url_type_statistics_async, get_urls_by_type_and_icp_async, ensure_collection_exists
+from web_url_scraper.google_service import COMPANY_DIRECTORY_DOMAINS
+# Platform scrapers (web, Instagram, LinkedIn, YouTube, Facebook) are imported lazily
+# in run_selected_scrapers so unselected browser stacks are never loaded
 # from Company_directory.company_scraper_complete import UniversalScraper  # Commented out - company scraper disabled
 from database.mongodb_manager import get_mongodb_manager
 from filter_web_lead import MongoDBLeadProcessor
@@ -48,20 +50,43 @@ from scraper_registry import (
     get_url_type_map,
 )
 
-# Import Gemini AI (assuming it's available)
+# Gemini AI (google.generativeai) is imported lazily the first time a model is needed
 try:
-    import google.generativeai as genai
     from dotenv import load_dotenv
     load_dotenv()
-    GEMINI_AVAILABLE = True
 except ImportError:
-    GEMINI_AVAILABLE = False
-    print("⚠️ Gemini AI not available. Install google-generativeai package.")
+    pass
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Gemini responses are cached per prompt so an unchanged ICP skips the API call
+GEMINI_PROMPT_CACHE_COLLECTION = 'gemini_prompt_cache'
+GEMINI_PROMPT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Minimum spacing in seconds between starting web_url_scraper queries
+QUERY_RATE_LIMIT_PERIOD = 2.0
+
+
+def _url_host(url: str) -> str:
+    """Return the lowercased host of a URL by slicing, avoiding a full urlparse per URL"""
+    start = url.find('//')
+    if start == -1:
+        return ''
+    start += 2
+    end = len(url)
+    for separator in '/?#':
+        pos = url.find(separator, start, end)
+        if pos != -1:
+            end = pos
+    return url[start:end].lower()
+
+
+def _json_default(obj: Any) -> str:
+    """JSON fallback for report values that orjson cannot serialize natively (e.g. ObjectId)"""
+    return str(obj)
+
 
 class LeadGenerationOrchestrator:
     """Main orchestrator for the lead generation application"""
@@ -69,37 +94,48 @@ class LeadGenerationOrchestrator:
     def __init__(self):
         """Initialize the orchestrator"""
         self.mongodb_manager = None
+        self._prompt_cache = None
         # Centralized available scrapers
         self.available_scrapers = get_available_scrapers()
         
-        # Instagram scraper performance configuration
-        self.instagram_config = ScrapingConfig(
-            max_workers=4,
-            batch_size=5,
-            context_pool_size=4,
-            rate_limit_delay=1.0,
-            context_reuse_limit=20
-        )
+        # Instagram scraper performance configuration (built on first Instagram run)
+        self.instagram_config = None
         
         # Initialize MongoDB
         try:
             self.mongodb_manager = get_mongodb_manager()
+            self.mongodb_manager.warm_up_pool()
             logger.info("✅ MongoDB connection initialized")
         except Exception as e:
             logger.warning(f"⚠️ Failed to initialize MongoDB: {e}")
         
-        # Initialize Gemini AI if available
-        if GEMINI_AVAILABLE and os.getenv('GEMINI_API_KEY'):
+        # Gemini AI is initialized on first use (see gemini_model)
+        self._gemini_model = None
+        self._gemini_initialized = False
+    
+    @property
+    def gemini_model(self):
+        """Gemini model, importing and configuring google.generativeai on first access"""
+        if not self._gemini_initialized:
+            self._gemini_initialized = True
+            api_key = os.getenv('GEMINI_API_KEY')
             try:
-                genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-                self.gemini_model = genai.GenerativeModel('gemini-2.0-flash')
-                logger.info("✅ Gemini AI initialized")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to initialize Gemini AI: {e}")
-                self.gemini_model = None
-        else:
-            self.gemini_model = None
-            logger.warning("⚠️ Gemini AI not available")
+                import google.generativeai as genai
+            except ImportError:
+                genai = None
+                print("⚠️ Gemini AI not available. Install google-generativeai package.")
+            
+            if genai and api_key:
+                try:
+                    genai.configure(api_key=api_key)
+                    self._gemini_model = genai.GenerativeModel('gemini-2.0-flash')
+                    logger.info("✅ Gemini AI initialized")
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to initialize Gemini AI: {e}")
+                    self._gemini_model = None
+            else:
+                logger.warning("⚠️ Gemini AI not available")
+        return self._gemini_model
     
     def generate_icp_identifier(self, icp_data: Dict[str, Any]) -> str:
         """
@@ -299,10 +335,8 @@ class LeadGenerationOrchestrator:
             prompt = self._create_gemini_prompt(icp_data)
             
             logger.info("🤖 Generating search queries with Gemini AI...")
-            response = await asyncio.to_thread(self.gemini_model.generate_content, prompt)
-            
-            # Parse the response to extract queries
-            base_queries = self._parse_gemini_response(response.text)
+            # Stream the response and stop once enough base queries have been parsed
+            base_queries = await self._stream_gemini_queries(prompt, max_queries=2)
             print('*' * 80)
             print(base_queries)
             print('*' * 80)
@@ -330,8 +364,8 @@ class LeadGenerationOrchestrator:
         try:
             prompt = self._create_platform_prompt(icp_data, platform)
             logger.info(f"🤖 Generating platform-specific queries for {platform} with Gemini AI...")
-            response = await asyncio.to_thread(self.gemini_model.generate_content, prompt)
-            raw_lines = (response.text or '').split('\n')
+            response_text = await self._generate_gemini_text(prompt)
+            raw_lines = (response_text or '').split('\n')
             # Clean and keep only non-empty lines
             queries = []
             for line in raw_lines:
@@ -350,37 +384,161 @@ class LeadGenerationOrchestrator:
             logger.error(f"❌ Error generating platform queries with Gemini: {e}")
             return self._get_fallback_platform_queries(icp_data, platform)
     
+    def _get_prompt_cache(self):
+        """Get the Gemini prompt cache collection, creating its TTL index on first use"""
+        if self._prompt_cache is None and self.mongodb_manager:
+            collection = self.mongodb_manager.db[GEMINI_PROMPT_CACHE_COLLECTION]
+            collection.create_index('created_at', expireAfterSeconds=GEMINI_PROMPT_CACHE_TTL_SECONDS)
+            self._prompt_cache = collection
+        return self._prompt_cache
+
+    async def _read_prompt_cache(self, key: str):
+        """Return the cache collection and any cached response text for a prompt key"""
+        try:
+            cache = await asyncio.to_thread(self._get_prompt_cache)
+        except Exception as e:
+            logger.warning(f"⚠️ Gemini prompt cache unavailable: {e}")
+            return None, None
+        
+        if cache is not None:
+            try:
+                doc = await asyncio.to_thread(cache.find_one, {'_id': key})
+                if doc:
+                    logger.info("♻️ Using cached Gemini response")
+                    return cache, doc['response']
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to read Gemini prompt cache: {e}")
+        return cache, None
+
+    async def _write_prompt_cache(self, cache, key: str, response_text: str):
+        """Store Gemini response text under a prompt key"""
+        if cache is None or not response_text:
+            return
+        try:
+            await asyncio.to_thread(
+                cache.replace_one,
+                {'_id': key},
+                {'_id': key, 'response': response_text, 'created_at': datetime.utcnow()},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to store Gemini response in cache: {e}")
+
+    async def _generate_gemini_text(self, prompt: str) -> str:
+        """
+        Return Gemini's response text for a prompt, reusing a cached response
+        for an identical prompt when one is available
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cache, cached_text = await self._read_prompt_cache(key)
+        if cached_text is not None:
+            return cached_text
+        
+        response = await asyncio.to_thread(self.gemini_model.generate_content, prompt)
+        response_text = response.text
+        await self._write_prompt_cache(cache, key, response_text)
+        return response_text
+
+    async def _stream_gemini_queries(self, prompt: str, max_queries: int) -> List[str]:
+        """
+        Stream Gemini's response and parse it line by line, stopping as soon as
+        max_queries valid queries have arrived
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cache, cached_text = await self._read_prompt_cache(key)
+        if cached_text is not None:
+            return self._parse_gemini_response(cached_text)[:max_queries]
+        
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        
+        def produce():
+            # Runs in a worker thread; hands each streamed chunk to the event loop,
+            # then None when the stream ends or the exception that broke it
+            end = None
+            try:
+                for chunk in self.gemini_model.generate_content(prompt, stream=True):
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(chunks.put_nowait, chunk.text)
+            except Exception as e:
+                end = e
+            finally:
+                loop.call_soon_threadsafe(chunks.put_nowait, end)
+        
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+        text_parts = []
+        pending = ''
+        queries = []
+        completed = False
+        
+        try:
+            while len(queries) < max_queries:
+                chunk_text = await chunks.get()
+                if isinstance(chunk_text, Exception):
+                    # Surface Gemini errors so the caller falls back; nothing is cached
+                    raise chunk_text
+                if chunk_text is None:
+                    # Stream finished; the last line has no trailing newline
+                    completed = True
+                    query = self._clean_query_line(pending)
+                    if query:
+                        queries.append(query)
+                    break
+                
+                text_parts.append(chunk_text)
+                *lines, pending = (pending + chunk_text).split('\n')
+                for line in lines:
+                    query = self._clean_query_line(line)
+                    if query:
+                        queries.append(query)
+        finally:
+            stop.set()
+            # Wait for the worker to see the stop flag before returning, so it never
+            # posts to a loop that the caller (e.g. app.py's run_async) has closed
+            await producer
+        
+        # An early stop only has part of the response; caching it would hand the
+        # truncated text to every later reader of this prompt
+        if completed:
+            await self._write_prompt_cache(cache, key, ''.join(text_parts))
+        return queries[:max_queries]
+    
     def _add_platform_specific_queries(self, base_queries: List[str], selected_scrapers: List[str]) -> List[str]:
         """
         Add platform-specific versions of base queries based on selected scrapers
         """
-        all_queries = base_queries.copy()
-        
-        # Platform keywords mapping
         # Obtain site filter per scraper from registry
+        platform_filters = [(scraper, get_site_filter(scraper)) for scraper in selected_scrapers]
+        platform_filters = [(scraper, keyword) for scraper, keyword in platform_filters if keyword]
         
-        # Add platform-specific queries
-        for scraper in selected_scrapers:
-            platform_keyword = get_site_filter(scraper)
-            if platform_keyword:
-                logger.info(f"🔍 Adding {platform_keyword} specific queries...")
-                
-                for query in base_queries:
-                    # Strengthen with intitle and exact persona/industry signals if present
-                    enhanced_query = query
-                    if 'director' in query.lower() or 'manager' in query.lower() or 'head' in query.lower():
-                        enhanced_query = f'intitle:("director" OR "manager" OR "head") {query}'
-                    # Add platform site filter
-                    platform_query = f"{enhanced_query} {platform_keyword}".strip()
-                    all_queries.append(platform_query)
+        # Strengthen with intitle and exact persona/industry signals if present (same for every platform)
+        enhanced_queries = []
+        for query in base_queries:
+            query_lower = query.lower()
+            if 'director' in query_lower or 'manager' in query_lower or 'head' in query_lower:
+                enhanced_queries.append(f'intitle:("director" OR "manager" OR "head") {query}')
+            else:
+                enhanced_queries.append(query)
+        
+        for _, platform_keyword in platform_filters:
+            logger.info(f"🔍 Adding {platform_keyword} specific queries...")
+        
+        # Add platform site filter
+        all_queries = base_queries + [
+            f"{query} {platform_keyword}".strip()
+            for _, platform_keyword in platform_filters
+            for query in enhanced_queries
+        ]
         
         logger.info(f"📊 Query breakdown:")
         logger.info(f"  - Base queries: {len(base_queries)}")
-        for scraper in selected_scrapers:
-            if get_site_filter(scraper):
-                logger.info(f"  - {scraper} queries: {len(base_queries)}")
+        for scraper, _ in platform_filters:
+            logger.info(f"  - {scraper} queries: {len(base_queries)}")
         
         return all_queries
+
     def _create_gemini_prompt(self, icp_data: Dict[str, Any]) -> str:
         """Create a prompt for Gemini AI to generate search queries"""
         product = icp_data.get("product_details", {})
@@ -493,35 +651,42 @@ class LeadGenerationOrchestrator:
         """
         return prompt
     
+    def _clean_query_line(self, line: str) -> Optional[str]:
+        """Clean a single line of Gemini output, returning it if it looks like a search query"""
+        line = line.strip()
+        # Remove numbering, bullets, quotation marks, etc.
+        line = line.lstrip('0123456789.-• "\'')
+        line = line.rstrip('"\'')
+        
+        # Basic validation - check for minimum length and travel-related keywords
+        # travel_keywords = [
+        #     'travel', 'trip', 'tour', 'vacation', 'holiday', 'outing', 'wedding',
+        #     'corporate', 'group', 'family', 'pilgrimage', 'destination', 'bus',
+        #     'transport', 'planning', 'organizing', 'visiting', 'visit', 'travelling',
+        #     'journey', 'excursion', 'adventure','sightseeing', 'backpacking', 'trekking', 'hiking',
+        #     'roadtrip', 'road trip', 'picnic', 'camping', 'booking', 'reservation', 'package', 'deal', 'offer',
+        #     'explore', 'exploring', 'discover', 'discovering', 'wanderlust','company trip', 'staff outing',
+        #     'event', 'gathering', 'yatra','reunion', 'get-together', 'meetup'
+        # ]
+        
+        # if line and len(line) > 15:  # Increased minimum length
+        #     # Check if the query contains at least one travel-related keyword
+        #     if any(keyword.lower() in line.lower() for keyword in travel_keywords):
+        #         return line
+        
+        if line and len(line) > 15:  # Increased minimum length
+            return line
+        return None
+
     def _parse_gemini_response(self, response_text: str) -> List[str]:
         """Parse Gemini response to extract search queries"""
         queries = []
         lines = response_text.strip().split('\n')
         
         for line in lines:
-            line = line.strip()
-            # Remove numbering, bullets, quotation marks, etc.
-            line = line.lstrip('0123456789.-• "\'')
-            line = line.rstrip('"\'')
-            
-            # Basic validation - check for minimum length and travel-related keywords
-            # travel_keywords = [
-            #     'travel', 'trip', 'tour', 'vacation', 'holiday', 'outing', 'wedding',
-            #     'corporate', 'group', 'family', 'pilgrimage', 'destination', 'bus',
-            #     'transport', 'planning', 'organizing', 'visiting', 'visit', 'travelling',
-            #     'journey', 'excursion', 'adventure','sightseeing', 'backpacking', 'trekking', 'hiking',
-            #     'roadtrip', 'road trip', 'picnic', 'camping', 'booking', 'reservation', 'package', 'deal', 'offer',
-            #     'explore', 'exploring', 'discover', 'discovering', 'wanderlust','company trip', 'staff outing',
-            #     'event', 'gathering', 'yatra','reunion', 'get-together', 'meetup'
-            # ]
-            
-            # if line and len(line) > 15:  # Increased minimum length
-            #     # Check if the query contains at least one travel-related keyword
-            #     if any(keyword.lower() in line.lower() for keyword in travel_keywords):
-            #         queries.append(line)
-            
-            if line and len(line) > 15:  # Increased minimum length
-                queries.append(line)
+            query = self._clean_query_line(line)
+            if query:
+                queries.append(query)
 
         return queries
     
@@ -583,46 +748,46 @@ class LeadGenerationOrchestrator:
         """
         logger.info(f"🔍 Collecting URLs for {len(queries)} queries...")
         
-        # Initialize web_url_scraper
-        success = initialize_application()
+        # Initialize web_url_scraper (blocking PyMongo/HTTP work runs off the event loop)
+        success = await asyncio.to_thread(initialize_application)
         if not success:
             logger.warning("⚠️ web_url_scraper initialization failed, but continuing...")
         # Always continue even if initialization fails
         
         all_urls = []
         
-        for i, query in enumerate(queries, 1):
-            logger.info(f"[{i}/{len(queries)}] Processing query: {query}")
-            
+        # Shared token bucket: one query start per period, while earlier queries keep running
+        limiter = AsyncLimiter(1, QUERY_RATE_LIMIT_PERIOD)
+        
+        async def _run_one(i: int, query: str):
             try:
+                async with limiter:
+                    logger.info(f"[{i}/{len(queries)}] Processing query: {query}")
                 # Run web_url_scraper for this query
-                success = web_url_scraper_main(query, icp_identifier)
+                success = await web_url_scraper_main_async(query, icp_identifier)
                 if success:
                     logger.info(f"✅ Successfully processed query: {query}")
                 else:
                     logger.warning(f"⚠️ Failed to process query: {query}")
                     # Ensure collection exists even if query processing fails
                     try:
-                        from web_url_scraper.database_service import ensure_collection_exists
-                        ensure_collection_exists()
+                        await asyncio.to_thread(ensure_collection_exists)
                     except Exception as e:
                         logger.error(f"❌ Failed to ensure collection exists: {e}")
                 
-                # Add delay between queries to avoid rate limiting
-                await asyncio.sleep(2)
-                
             except Exception as e:
                 logger.error(f"❌ Error processing query '{query}': {e}")
                 # Ensure collection exists even if query processing fails
                 try:
-                    from web_url_scraper.database_service import ensure_collection_exists
-                    ensure_collection_exists()
+                    await asyncio.to_thread(ensure_collection_exists)
                 except Exception as e:
                     logger.error(f"❌ Failed to ensure collection exists: {e}")
+        
+        await asyncio.gather(*(_run_one(i, query) for i, query in enumerate(queries, 1)))
 
         try:
             # Get URL type statistics first to see what's available
-            stats = get_url_type_statistics()
+            stats = await get_url_type_statistics_async()
             logger.info(f"📊 Database contains {stats['total_urls']} URLs across {stats['unique_url_types']} types")
             
             # Initialize classified_urls dictionary from registry url types
@@ -632,7 +797,7 @@ class LeadGenerationOrchestrator:
             # Get URLs for each type directly from database
             for url_type in classified_urls.keys():
                 try:
-                    urls_data = get_urls_by_type_and_icp(url_type, icp_identifier)
+                    urls_data = await get_urls_by_type_and_icp_async(url_type, icp_identifier, fields=['url'])
                     # Extract just the URLs from the database documents
                     urls = [doc['url'] for doc in urls_data if 'url' in doc]
                     classified_urls[url_type] = urls
@@ -670,23 +835,9 @@ class LeadGenerationOrchestrator:
             'general': []
         }
         
-        # Known company directory domains
-        company_directory_domains = [
-            'thomasnet.com', 'indiamart.com', 'kompass.com', 'yellowpages.com',
-            'yelp.com', 'crunchbase.com', 'opencorporates.com', 'manta.com',
-            'dexknows.com', 'superpages.com', 'bizdir.com', 'businessdirectory.com',
-            'local.com', 'bbb.org', 'angieslist.com', 'houzz.com', 'thumbtack.com',
-            'homeadvisor.com', 'angi.com', 'cylex.net', 'tuugo.us', 'hotfrog.com',
-            'brownbook.net', 'citysearch.com', 'insiderpages.com', 'showmelocal.com',
-            'getthedata.co', 'companycheck.co.uk', 'duedil.com', 'thesunbusinessdirectory.com',
-            'yell.com', 'touchlocal.com', 'cylex-uk.co.uk', 'ukindex.co.uk',
-            'findopen.co.uk', 'thesun.co.uk', 'scotsman.com', 'telegraph.co.uk',
-            'independent.co.uk'
-        ]
-        
         for url_data in urls_data:
             url = url_data.get('url', '')
-            domain = urlparse(url).netloc.lower()
+            domain = _url_host(url)
             
             if 'instagram.com' in domain:
                 classified['instagram'].append(url)
@@ -696,7 +847,7 @@ class LeadGenerationOrchestrator:
                 classified['youtube'].append(url)
             elif 'facebook.com' in domain:
                 classified['facebook'].append(url)
-            elif any(cd_domain in domain for cd_domain in company_directory_domains):
+            elif any(cd_domain in domain for cd_domain in COMPANY_DIRECTORY_DOMAINS):
                 classified['company_directory'].append(url)
             else:
                 classified['general'].append(url)
@@ -822,6 +973,8 @@ class LeadGenerationOrchestrator:
         if 'web_scraper' in selected_scrapers and classified_urls.get('general'):
             logger.info("🌐 Running web_scraper...")
             try:
+                from web_scraper.main_app import WebScraperOrchestrator
+                
                 web_scraper = WebScraperOrchestrator(
                     enable_ai=False,
                     enable_quality_engine=False,
@@ -843,7 +996,7 @@ class LeadGenerationOrchestrator:
                     try:
                         # Get the successful leads data
                         leads_data = web_results['unified_leads']
-                        unified_stats = self.mongodb_manager.insert_batch_unified_leads(leads_data) if leads_data else {
+                        unified_stats = await asyncio.to_thread(self.mongodb_manager.insert_batch_unified_leads, leads_data) if leads_data else {
                             'success_count': 0,'duplicate_count':0,'failure_count':0,'total_processed':0
                         }
                         
@@ -1010,6 +1163,17 @@ class LeadGenerationOrchestrator:
         if 'instagram' in selected_scrapers and classified_urls.get('instagram'):
             logger.info("📸 Running optimized Instagram scraper...")
             try:
+                from instagram_scraper.main_optimized import OptimizedInstagramScraper, ScrapingConfig
+                
+                if self.instagram_config is None:
+                    self.instagram_config = ScrapingConfig(
+                        max_workers=4,
+                        batch_size=5,
+                        context_pool_size=4,
+                        rate_limit_delay=1.0,
+                        context_reuse_limit=20
+                    )
+                
                 # Use configured Instagram scraper settings
                 instagram_scraper = OptimizedInstagramScraper(
                     headless=True,
@@ -1038,7 +1202,7 @@ class LeadGenerationOrchestrator:
                         if not unified_leads:
                             unified_leads = [instagram_scraper._transform_instagram_to_unified(entry, icp_identifier) for entry in leads_data]
                             unified_leads = [u for u in unified_leads if u]
-                        unified_stats = self.mongodb_manager.insert_batch_unified_leads(unified_leads) if unified_leads else {
+                        unified_stats = await asyncio.to_thread(self.mongodb_manager.insert_batch_unified_leads, unified_leads) if unified_leads else {
                             'success_count': 0,'duplicate_count':0,'failure_count':0,'total_processed':0
                         }
                         
@@ -1082,6 +1246,8 @@ class LeadGenerationOrchestrator:
         if 'linkedin' in selected_scrapers and classified_urls.get('linkedin'):
             logger.info("💼 Running optimized LinkedIn scraper...")
             try:
+                from linkedin_scraper.main import OptimizedLinkedInScraper
+                
                 # Use optimized LinkedIn scraper with rate limit delay
                 linkedin_scraper = OptimizedLinkedInScraper(
                     headless=True,
@@ -1119,7 +1285,7 @@ class LeadGenerationOrchestrator:
                             leads_data = linkedin_results['scraped_data']
                             unified_leads = [linkedin_scraper._transform_linkedin_to_unified(item, icp_identifier) for item in leads_data]
                             unified_leads = [u for u in unified_leads if u]
-                        unified_stats = self.mongodb_manager.insert_batch_unified_leads(unified_leads) if unified_leads else {
+                        unified_stats = await asyncio.to_thread(self.mongodb_manager.insert_batch_unified_leads, unified_leads) if unified_leads else {
                             'success_count': 0,'duplicate_count':0,'failure_count':0,'total_processed':0
                         }
                         
@@ -1149,6 +1315,8 @@ class LeadGenerationOrchestrator:
         if 'youtube' in selected_scrapers and classified_urls.get('youtube'):
             logger.info("🎥 Running YouTube scraper...")
             try:
+                from yt_scraper.main import YouTubeScraperInterface
+                
                 youtube_scraper = YouTubeScraperInterface(
                     headless=True,
                     enable_anti_detection=True,
@@ -1173,7 +1341,7 @@ class LeadGenerationOrchestrator:
                             unified_leads = [youtube_scraper._transform_youtube_to_unified(item, icp_identifier) for item in leads_data]
                             unified_leads = [u for u in unified_leads if u]
                         
-                        unified_stats = self.mongodb_manager.insert_batch_unified_leads(unified_leads) if unified_leads else {
+                        unified_stats = await asyncio.to_thread(self.mongodb_manager.insert_batch_unified_leads, unified_leads) if unified_leads else {
                             'success_count': 0, 'duplicate_count': 0, 'failure_count': 0, 'total_processed': 0
                         }
                         
@@ -1216,6 +1384,8 @@ class LeadGenerationOrchestrator:
         if 'facebook' in selected_scrapers and classified_urls.get('facebook'):
             logger.info("📘 Running optimized Facebook scraper...")
             try:
+                from facebook_scraper.main_optimized import OptimizedFacebookScraper, FacebookScrapingConfig
+                
                 # Use configured Facebook scraper settings
                 facebook_config = FacebookScrapingConfig(
                     max_workers=3,
@@ -1251,7 +1421,7 @@ class LeadGenerationOrchestrator:
                         if not unified_leads:
                             unified_leads = [facebook_scraper._transform_facebook_to_unified(entry, icp_identifier) for entry in leads_data]
                             unified_leads = [u for u in unified_leads if u]
-                        unified_stats = self.mongodb_manager.insert_batch_unified_leads(unified_leads) if unified_leads else {
+                        unified_stats = await asyncio.to_thread(self.mongodb_manager.insert_batch_unified_leads, unified_leads) if unified_leads else {
                             'success_count': 0,'duplicate_count':0,'failure_count':0,'total_processed':0
                         }
                         
@@ -1298,9 +1468,10 @@ class LeadGenerationOrchestrator:
         """
         Generate a final report of the orchestration results
         """
+        _now = datetime.now()
         report_data = {
             "orchestration_metadata": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now.isoformat(),
                 "icp_data": icp_data,
                 "selected_scrapers": selected_scrapers,
                 "total_scrapers_run": len([r for r in results.values() if not r.get('error')])
@@ -1422,11 +1593,16 @@ class LeadGenerationOrchestrator:
                 #         }
         
         # Save report
-        report_filename = f"orchestration_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        report_filename = f"orchestration_report_{_now.strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with open(report_filename, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False, default=str)
+            report_bytes = orjson.dumps(
+                report_data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+            with open(report_filename, 'wb') as f:
+                f.write(report_bytes)
             
             logger.info(f"📊 Final report saved: {report_filename}")
             return report_filename
@@ -1593,7 +1769,7 @@ class LeadGenerationOrchestrator:
             for key, urls in classified_urls.items():
                 print(f"{key}: {len(urls)}")
 
-            successful_scrapers = len([r for r in results.values() if not r.get('error') and r != results.get('lead_filtering')])
+            successful_scrapers = sum(1 for name, r in results.items() if name != 'lead_filtering' and not r.get('error'))
             print(f"✅ Successful scrapers: {successful_scrapers}/{len(selected_scrapers)}")
             
             """
@@ -28,7 +28,9 @@ class PageContent(BaseModel):
 class Lead(BaseModel):
 	# Minimal lead model aligned with plan Phase 7.1 (will expand later phases)
 	id: Optional[str] = None
-	source_url: Optional[HttpUrl] = None
+	# Plain str: in Pydantic v2 HttpUrl is a Url object, not a str, and the pipeline
+	# passes and consumes these URLs as plain strings (urlparse, dict export)
+	source_url: Optional[str] = None
 	extraction_timestamp: Optional[str] = None
 
 	business_name: Optional[str] = None
@@ -36,7 +38,7 @@ class Lead(BaseModel):
 	email: Optional[str] = None
 	phone: Optional[str] = None
 	address: Optional[str] = None
-	website: Optional[HttpUrl] = None
+	website: Optional[str] = None
 
 	social_media: Dict[str, str] = Field(default_factory=dict)
 	industry: Optional[str] = None
@@ -15,6 +15,7 @@ from typing import List, Dict, Any, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+import orjson
 from loguru import logger
 from pydantic import ValidationError
 
@@ -26,7 +27,7 @@ from web_scraper.ai_integration.ai import disambiguate_business_entities, genera
 from web_scraper.extractors.lead_extraction import extract_lead_information, smart_filter_sections
 from web_scraper.processors.data_quality import process_leads_with_quality_engine
 from web_scraper.storage.storage import LeadModel, LeadStorage
-from web_scraper.storage.export import ExportManager
+from web_scraper.storage.export import ExportManager, JSON_DUMP_OPTIONS
 
 import os
 import re
@@ -740,8 +741,8 @@ class WebScraperOrchestrator:
             # Save to file
             final_leads_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(final_leads_path, 'w', encoding='utf-8') as f:
-                json.dump(final_data, f, indent=2, ensure_ascii=False, default=str)
+            with open(final_leads_path, 'wb') as f:
+                f.write(orjson.dumps(final_data, default=str, option=JSON_DUMP_OPTIONS))
             
             logger.info(f"Final leads saved to: {final_leads_path}")
             return str(final_leads_path), final_data["leads"]
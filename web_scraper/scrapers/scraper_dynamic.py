@@ -133,7 +133,7 @@ async def _dismiss_popups(page, adm: Optional[AntiDetectionManager] = None):
 
 async def fetch_dynamic_async(url: str, wait_for_selector: Optional[str] = None, timeout_ms: int = 30000) -> PageContent:
 	async_playwright = await _ensure_playwright()
-	start = time.time()
+	start = time.perf_counter()
 	async with async_playwright() as pw:
 		browser, context, adm = await _create_context(pw)
 		page = await context.new_page()
@@ -204,7 +204,7 @@ async def fetch_dynamic_async(url: str, wait_for_selector: Optional[str] = None,
 
 		html = await page.content()
 		status = (resp.status if resp else 200)
-		elapsed = time.time() - start
+		elapsed = time.perf_counter() - start
 
 		await context.close()
 		await browser.close()
@@ -12,6 +12,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 from web_scraper.data_models.models import PageContent
 from web_scraper.utils.anti_detection import AntiDetectionManager
+from web_scraper.utils.timing import timed
 
 
 _DEFAULT_HEADERS = {
@@ -75,13 +76,13 @@ class StaticScraper:
 	)
 	def fetch(self, url: str) -> PageContent:
 		logger.info(f"Fetching URL (static): {url}")
-		start = time.time()
-		self._apply_network_delay_and_rotate_if_needed()
-		headers = self._build_headers()
-		self._session.headers.clear()
-		self._session.headers.update(headers)
-		resp = self._session.get(url, timeout=self.timeout)
-		elapsed = time.time() - start
+		with timed(f"Static fetch {url}") as fetch_timer:
+			self._apply_network_delay_and_rotate_if_needed()
+			headers = self._build_headers()
+			self._session.headers.clear()
+			self._session.headers.update(headers)
+			resp = self._session.get(url, timeout=self.timeout)
+		elapsed = fetch_timer.elapsed
 		# If blocked by common anti-bot statuses, attempt dynamic fallback inline
 		if resp.status_code in {403, 429, 503}:
 			from loguru import logger as _logger
@@ -9,9 +9,14 @@ from typing import Any, Dict, List, Optional, Union
 import zipfile
 import io
 
+import orjson
 from loguru import logger
 from web_scraper.storage.storage import LeadModel, LeadStorage, LeadStatus
 
+# orjson equivalent of json.dump(..., indent=2, default=str): datetimes still go
+# through default=str so exported timestamps keep their existing format
+JSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
 
 class ExportMetadata(dict):
     """Export metadata for tracking and validation"""
@@ -67,13 +72,14 @@ class JSONExporter:
         }
         
         # Write to file
+        payload = orjson.dumps(export_data, default=str, option=JSON_DUMP_OPTIONS)
         if self.compress:
             output_file = output_file.with_suffix(output_file.suffix + '.gz')
-            with gzip.open(output_file, 'wt', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+            with gzip.open(output_file, 'wb') as f:
+                f.write(payload)
         else:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+            with open(output_file, 'wb') as f:
+                f.write(payload)
                 
         logger.info(f"Exported {len(leads)} leads to JSON: {output_file}")
         return str(output_file)
@@ -83,11 +89,11 @@ class JSONExporter:
         
         try:
             if json_file.endswith('.gz'):
-                with gzip.open(json_file, 'rt', encoding='utf-8') as f:
-                    data = json.load(f)
+                with gzip.open(json_file, 'rb') as f:
+                    data = orjson.loads(f.read())
             else:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                     
             validation_result = {
                 "valid": True,
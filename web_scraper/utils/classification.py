@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import re
-import time
 from typing import Dict, List, Tuple, Optional
 
 import requests
@@ -10,6 +9,7 @@ from loguru import logger
 
 from web_scraper.data_models.models import ClassificationResult
 from web_scraper.utils.classification_cache import ClassificationCache
+from web_scraper.utils.timing import timed
 
 
 _DEFAULT_HEADERS = {
@@ -116,9 +116,9 @@ def classify_url(url: str, timeout: int = 20, override_classification: Optional[
 
 	# HEAD analysis
 	try:
-		start = time.time()
-		h = requests.head(url, headers=headers, allow_redirects=True, timeout=timeout)
-		elapsed = time.time() - start
+		with timed() as head_timer:
+			h = requests.head(url, headers=headers, allow_redirects=True, timeout=timeout)
+		elapsed = head_timer.elapsed
 		status_code = h.status_code
 		content_type = h.headers.get("Content-Type", "").lower()
 		server = h.headers.get("Server")
@@ -142,9 +142,9 @@ def classify_url(url: str, timeout: int = 20, override_classification: Optional[
 	# GET initial HTML
 	html = ""
 	try:
-		start = time.time()
-		r = requests.get(url, headers=headers, allow_redirects=True, timeout=timeout)
-		elapsed_get = time.time() - start
+		with timed() as get_timer:
+			r = requests.get(url, headers=headers, allow_redirects=True, timeout=timeout)
+		elapsed_get = get_timer.elapsed
 		status_code = r.status_code
 		indicators["get_elapsed_s"] = elapsed_get
 		ct = (r.headers.get("Content-Type") or "").lower()
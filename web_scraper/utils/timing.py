@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Iterator, Optional
+
+from loguru import logger
+
+
+@contextmanager
+def timed(label: Optional[str] = None) -> Iterator[SimpleNamespace]:
+	"""Measure the wall time of a block with the monotonic perf counter.
+
+	The yielded object gets an ``elapsed`` attribute (seconds, float) once the
+	block exits, even if it raised. With a label, the duration is also logged at
+	debug level.
+	"""
+	timer = SimpleNamespace(elapsed=0.0)
+	start_ns = time.perf_counter_ns()
+	try:
+		yield timer
+	finally:
+		timer.elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+		if label:
+			logger.debug(f"{label} took {timer.elapsed:.3f}s")
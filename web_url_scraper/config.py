@@ -12,6 +12,10 @@ MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/')
 MONGODB_DATABASE_NAME = os.getenv('MONGODB_DATABASE_NAME', 'aiqod-dev')
 MONGODB_COLLECTION_NAME = os.getenv('MONGODB_COLLECTION_NAME', 'scraped_urls')
 
+# Acknowledge URL writes from the primary only, without waiting for the journal or
+# replicas. Trades durability of the latest writes for insert speed; bulk/test runs only.
+FAST_INSERT = os.getenv('FAST_INSERT', '').strip().lower() in ('1', 'true', 'yes')
+
 # MVP Constants (hardcoded for MVP)
 MAX_PAGES = 2
 RESULTS_PER_PAGE = 10
@@ -73,6 +77,7 @@ def get_config_summary():
         'mongodb_uri': MONGODB_URI,
         'mongodb_database': MONGODB_DATABASE_NAME,
         'mongodb_collection': MONGODB_COLLECTION_NAME,
+        'fast_insert': FAST_INSERT,
         'max_pages': MAX_PAGES,
         'results_per_page': RESULTS_PER_PAGE
     } 
\ No newline at end of file
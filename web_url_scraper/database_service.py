@@ -1,28 +1,139 @@
-from pymongo import MongoClient
+import asyncio
+import atexit
+import logging
+import threading
+import xxhash
+from collections import OrderedDict
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from pymongo.write_concern import WriteConcern
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
 from web_url_scraper.config import (
     MONGODB_URI, 
     MONGODB_DATABASE_NAME, 
-    MONGODB_COLLECTION_NAME
+    MONGODB_COLLECTION_NAME,
+    FAST_INSERT
 )
 
+logger = logging.getLogger(__name__)
+
+# Motor gives the orchestrator non-blocking reads; fall back to threads without it
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    MOTOR_AVAILABLE = True
+except ImportError:
+    MOTOR_AVAILABLE = False
+
+# Documents fetched per cursor round trip for unbounded finds
+FIND_BATCH_SIZE = 500
+
+# url_hash values this process has stored or seen rejected as duplicates, most
+# recent last; lets repeat URLs across queries skip the database entirely
+SEEN_URL_CACHE_SIZE = 100_000
+_seen_url_hashes = OrderedDict()
+_seen_lock = threading.Lock()
+
+# None inherits the client/server default write concern
+URL_WRITE_CONCERN = WriteConcern(w=1, j=False) if FAST_INSERT else None
+
+# Index key specs built by setup_database_indexes for the url_type and query lookups
+URL_TYPE_INDEX = [('url_type', 1)]
+QUERY_TYPE_INDEX = [('search_query', 1), ('url_type', 1)]
+
+# Histogram of documents per url_type; documents saved before url_type existed count
+# as 'general', the type new documents default to, so no group is keyed by None
+URL_TYPE_COUNT_PIPELINE = [{'$group': {'_id': {'$ifNull': ['$url_type', 'general']}, 'count': {'$sum': 1}}}]
+
+# Wire compression for title/snippet-heavy URL documents; the driver negotiates
+# the first algorithm the server supports and skips any whose library is missing
+MONGODB_COMPRESSORS = 'zstd,snappy,zlib'
+
+# Shared clients, created on first use and reused by every call
+_client = None
+_client_lock = threading.Lock()
+# Motor clients are bound to the event loop that created them, and callers such as
+# the Flask backend run each request on a fresh loop, so keep one client per loop
+_async_clients = {}
+_async_clients_lock = threading.Lock()
+
+# initialize_database runs once per process; concurrent query pipelines share it
+_database_initialized = False
+_initialize_lock = threading.Lock()
+
+def _close_client():
+    if _client is not None:
+        _client.close()
+    with _async_clients_lock:
+        for client in _async_clients.values():
+            client.close()
+        _async_clients.clear()
+
+atexit.register(_close_client)
+
+def normalize_url(url):
+    """
+    Normalize a URL for duplicate detection (trim whitespace, lowercase scheme and host).
+    
+    Args:
+        url (str): URL to normalize
+    
+    Returns:
+        str: Normalized URL
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, parts.fragment))
+
+def url_hash(url):
+    """
+    Compute the 64-bit key used by the unique url_hash index.
+    
+    Args:
+        url (str): URL to hash
+    
+    Returns:
+        int: Signed 64-bit xxHash of the normalized URL (BSON int64)
+    """
+    digest = xxhash.xxh64_intdigest(normalize_url(url))
+    # BSON integers are signed; fold the unsigned digest into int64 range
+    return digest - (1 << 64) if digest >= (1 << 63) else digest
+
+def normalize_query(search_query):
+    """
+    Return the stored form of a search query (lowercase, for case-insensitive matching).
+    
+    Callers issuing several lookups for one query should normalize it once and use
+    the *_normalized helpers.
+    
+    Args:
+        search_query (str): Search query as entered
+    
+    Returns:
+        str: Normalized search query
+    """
+    return search_query.lower()
+
 def get_database_connection():
     """
-    Create and return a MongoDB database connection.
+    Return the MongoDB database from the shared client, creating the client on first use.
     
     Returns:
         pymongo.database.Database: Database object
     """
+    global _client
     try:
-        print("Connecting to MongoDB...")
-        client = MongoClient(MONGODB_URI)
-        
-        # Test connection
-        client.admin.command('ping')
-        print("MongoDB connection successful!")
+        if _client is None:
+            with _client_lock:
+                if _client is None:
+                    print("Connecting to MongoDB...")
+                    _client = MongoClient(MONGODB_URI, maxPoolSize=50, compressors=MONGODB_COMPRESSORS, zlibCompressionLevel=6)
         
         # Return database object
-        return client[MONGODB_DATABASE_NAME]
+        return _client[MONGODB_DATABASE_NAME]
         
     except Exception as e:
         print(f"MongoDB connection failed: {e}")
@@ -37,11 +148,30 @@ def get_collection():
     """
     try:
         db = get_database_connection()
-        return db[MONGODB_COLLECTION_NAME]
+        return db.get_collection(MONGODB_COLLECTION_NAME, write_concern=URL_WRITE_CONCERN)
     except Exception as e:
         print(f"Failed to get collection: {e}")
         raise
 
+def get_async_collection():
+    """
+    Get the MongoDB collection through the Motor client of the running event loop.
+    Must be called from a coroutine.
+    
+    Returns:
+        motor.motor_asyncio.AsyncIOMotorCollection: Collection object
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        # Release the pools of clients whose loop has finished (one per Flask request)
+        for closed_loop in [other for other in _async_clients if other.is_closed()]:
+            _async_clients.pop(closed_loop).close()
+        client = _async_clients.get(loop)
+        if client is None:
+            client = AsyncIOMotorClient(MONGODB_URI, io_loop=loop, compressors=MONGODB_COMPRESSORS, zlibCompressionLevel=6)
+            _async_clients[loop] = client
+    return client[MONGODB_DATABASE_NAME].get_collection(MONGODB_COLLECTION_NAME, write_concern=URL_WRITE_CONCERN)
+
 def ensure_collection_exists():
     """
     Explicitly create the collection if it doesn't exist and set up indexes.
@@ -70,26 +200,35 @@ def ensure_collection_exists():
 def initialize_database():
     """
     Initialize the database by ensuring collection exists and indexes are set up.
-    Call this before any database operations.
+    Call this before any database operations; calls after the first successful
+    initialization return immediately.
     """
-    print("Initializing database...")
-    
-    # Test connection first
-    if not test_database_connection():
-        print("Database connection failed")
-    
-    # Ensure collection exists
-    if not ensure_collection_exists():
-        print("Failed to create collection")
-    
-    # Set up indexes after collection is confirmed to exist
-    try:
-        setup_database_indexes()
-        print("Database indexes set up successfully!")
-    except Exception as e:
-        print(f"Warning: Failed to set up indexes: {e}")
-
-    print("Database initialization complete!")
+    global _database_initialized
+    with _initialize_lock:
+        if _database_initialized:
+            return True
+        
+        print("Initializing database...")
+        
+        # Test connection first
+        connected = test_database_connection()
+        if not connected:
+            print("Database connection failed")
+        
+        # Ensure collection exists
+        if not ensure_collection_exists():
+            print("Failed to create collection")
+        
+        # Set up indexes after collection is confirmed to exist
+        try:
+            setup_database_indexes()
+            print("Database indexes set up successfully!")
+        except Exception as e:
+            print(f"Warning: Failed to set up indexes: {e}")
+        
+        # Retry on the next call if the server was unreachable
+        _database_initialized = connected
+        print("Database initialization complete!")
     return True
 
 def save_url(url_data, search_query, icp_identifier='default'):
@@ -107,38 +246,86 @@ def save_url(url_data, search_query, icp_identifier='default'):
     try:
         collection = get_collection()
         
-        # Check for existing URL
-        existing = collection.find_one({'url': url_data['url']})
-        if existing:
-            return False  # URL already exists
-        
         # Create document
+        now = datetime.utcnow()
+        hashed_url = url_hash(url_data['url'])
         document = {
             'url': url_data['url'],
+            'url_hash': hashed_url,
             'title': url_data.get('title', ''),
             'snippet': url_data.get('snippet', ''),
             'url_type': url_data.get('url_type', 'general'),  # Add URL type field
-            'search_query': search_query.lower(),  # Store in lowercase for case-insensitive matching
+            'search_query': normalize_query(search_query),  # Store in lowercase for case-insensitive matching
             'icp_identifier': icp_identifier,  # Add ICP identifier
-            'created_at': datetime.now(),
-            'scraped_at': datetime.now()  # Use datetime instead of date
+            'created_at': now,
+            'scraped_at': now  # Use datetime instead of date
         }
         
-        # Insert document
-        result = collection.insert_one(document)
+        # Atomic upsert: only inserts when no document has this url_hash
+        result = collection.update_one(
+            {'url_hash': hashed_url},
+            {'$setOnInsert': document},
+            upsert=True
+        )
         
-        if result.inserted_id:
-            return True
-        else:
-            return False
+        return result.upserted_id is not None
             
     except Exception as e:
         print(f"Error saving URL {url_data.get('url', 'unknown')}: {e}")
         return False
 
-def save_multiple_urls(urls_list, search_query, icp_identifier='default'):
+def _drop_seen_documents(documents):
     """
-    Save multiple URLs to the database and return statistics.
+    Remove documents whose url_hash is already stored, per the in-process cache,
+    or repeated earlier in the same batch.
+    
+    Args:
+        documents (list): Documents from _build_url_documents
+    
+    Returns:
+        list: Documents that still need a database write
+    """
+    fresh = []
+    batch_hashes = set()
+    with _seen_lock:
+        for document in documents:
+            hashed_url = document['url_hash']
+            if hashed_url in _seen_url_hashes:
+                _seen_url_hashes.move_to_end(hashed_url)
+            elif hashed_url not in batch_hashes:
+                batch_hashes.add(hashed_url)
+                fresh.append(document)
+    return fresh
+
+def _remember_stored(documents, write_errors=()):
+    """
+    Record the url_hash of documents now known to be in the database.
+    
+    Args:
+        documents (list): Documents sent in the write
+        write_errors (list): writeErrors from a BulkWriteError; failures other than
+            duplicate keys are not recorded
+    """
+    failed = {error['index'] for error in write_errors if error['code'] != 11000}
+    with _seen_lock:
+        for index, document in enumerate(documents):
+            if index not in failed:
+                _seen_url_hashes[document['url_hash']] = None
+                _seen_url_hashes.move_to_end(document['url_hash'])
+        while len(_seen_url_hashes) > SEEN_URL_CACHE_SIZE:
+            _seen_url_hashes.popitem(last=False)
+
+def _forget_seen(hashed_url=None):
+    """Invalidate the seen-URL cache after deletes (one hash, or everything)."""
+    with _seen_lock:
+        if hashed_url is None:
+            _seen_url_hashes.clear()
+        else:
+            _seen_url_hashes.pop(hashed_url, None)
+
+def _build_url_documents(urls_list, search_query, icp_identifier):
+    """
+    Build the documents stored for a batch of URLs from one search query.
     
     Args:
         urls_list (list): List of URL dictionaries
@@ -146,58 +333,233 @@ def save_multiple_urls(urls_list, search_query, icp_identifier='default'):
         icp_identifier (str): ICP identifier for tracking
     
     Returns:
-        dict: Statistics about the operation
+        list: Documents ready for insert_many
     """
+    search_query_lower = normalize_query(search_query)  # Store in lowercase for case-insensitive matching
+    now = datetime.utcnow()  # One timestamp for the whole batch
+    return [
+        {
+            'url': url_data['url'],
+            'url_hash': url_hash(url_data['url']),
+            'title': url_data.get('title', ''),
+            'snippet': url_data.get('snippet', ''),
+            'url_type': url_data.get('url_type', 'general'),
+            'search_query': search_query_lower,
+            'icp_identifier': icp_identifier,
+            'created_at': now,
+            'scraped_at': now
+        }
+        for url_data in urls_list
+    ]
 
-    total_processed = 0
-    new_inserted = 0
-    duplicates_skipped = 0
+def _bulk_write_error_counts(bwe):
+    """
+    Split a BulkWriteError from an unordered insert into inserted and duplicate counts.
     
-    print(f"Processing {len(urls_list)} URLs for storage...")
+    Args:
+        bwe (BulkWriteError): Error raised by insert_many(ordered=False)
     
-    for url_data in urls_list:
-        total_processed += 1
-        
-        if save_url(url_data, search_query, icp_identifier):
-            new_inserted += 1
-        else:
-            duplicates_skipped += 1
+    Returns:
+        tuple: (new_inserted, duplicates_skipped)
+    """
+    write_errors = bwe.details['writeErrors']
+    duplicates_skipped = sum(1 for error in write_errors if error['code'] == 11000)
+    failed = len(write_errors) - duplicates_skipped
+    if failed:
+        print(f"Failed to save {failed} URLs: {write_errors[0].get('errmsg', 'unknown error')}")
+    return bwe.details['nInserted'], duplicates_skipped
+
+def _storage_statistics(total_processed, new_inserted, duplicates_skipped):
+    """
+    Report and return the statistics dictionary for a storage batch.
     
-    statistics = {
+    Returns:
+        dict: Statistics about the operation
+    """
+    print(f"Storage complete: {new_inserted} new URLs, {duplicates_skipped} duplicates skipped")
+    return {
         'total_processed': total_processed,
         'new_inserted': new_inserted,
         'duplicates_skipped': duplicates_skipped
     }
+
+def _prepare_url_batch(urls_list, search_query, icp_identifier):
+    """
+    Build the documents for a batch and drop URLs already known to be stored.
     
-    print(f"Storage complete: {new_inserted} new URLs, {duplicates_skipped} duplicates skipped")
-    return statistics
+    Args:
+        urls_list (list): List of URL dictionaries
+        search_query (str): Original search query
+        icp_identifier (str): ICP identifier for tracking
+    
+    Returns:
+        tuple: (documents to insert, duplicates_skipped before the insert)
+    """
+    print(f"Processing {len(urls_list)} URLs for storage...")
+    documents = _drop_seen_documents(_build_url_documents(urls_list, search_query, icp_identifier))
+    return documents, len(urls_list) - len(documents)
+
+def _insert_outcome(documents, result=None, error=None):
+    """
+    Count the outcome of one insert_many of a prepared batch and update the seen-URL cache.
+    
+    Args:
+        documents (list): Documents sent in the insert
+        result (InsertManyResult): Result of a successful insert
+        error (Exception): Exception raised by the insert instead
+    
+    Returns:
+        tuple: (new_inserted, duplicates_skipped)
+    """
+    if isinstance(error, BulkWriteError):
+        _remember_stored(documents, error.details['writeErrors'])
+        return _bulk_write_error_counts(error)
+    if error is not None:
+        print(f"Error saving URLs: {error}")
+        return 0, 0
+    _remember_stored(documents)
+    return len(result.inserted_ids), 0
+
+def save_multiple_urls(urls_list, search_query, icp_identifier='default'):
+    """
+    Save multiple URLs to the database in a single batch and return statistics.
+    Duplicates are rejected by the unique index on url_hash.
+    
+    Args:
+        urls_list (list): List of URL dictionaries
+        search_query (str): Original search query
+        icp_identifier (str): ICP identifier for tracking
+    
+    Returns:
+        dict: Statistics about the operation
+    """
+    documents, duplicates_skipped = _prepare_url_batch(urls_list, search_query, icp_identifier)
+    new_inserted = 0
+    
+    if documents:
+        try:
+            collection = get_collection()
+            result = collection.insert_many(documents, ordered=False)
+        except Exception as e:
+            new_inserted, rejected = _insert_outcome(documents, error=e)
+        else:
+            new_inserted, rejected = _insert_outcome(documents, result)
+        duplicates_skipped += rejected
+    
+    return _storage_statistics(len(urls_list), new_inserted, duplicates_skipped)
+
+async def save_multiple_urls_async(urls_list, search_query, icp_identifier='default'):
+    """
+    Async version of save_multiple_urls that does not block the event loop.
+    
+    Args:
+        urls_list (list): List of URL dictionaries
+        search_query (str): Original search query
+        icp_identifier (str): ICP identifier for tracking
+    
+    Returns:
+        dict: Statistics about the operation
+    """
+    if not MOTOR_AVAILABLE:
+        return await asyncio.to_thread(save_multiple_urls, urls_list, search_query, icp_identifier)
+    
+    documents, duplicates_skipped = _prepare_url_batch(urls_list, search_query, icp_identifier)
+    new_inserted = 0
+    
+    if documents:
+        try:
+            collection = get_async_collection()
+            result = await collection.insert_many(documents, ordered=False)
+        except Exception as e:
+            new_inserted, rejected = _insert_outcome(documents, error=e)
+        else:
+            new_inserted, rejected = _insert_outcome(documents, result)
+        duplicates_skipped += rejected
+    
+    return _storage_statistics(len(urls_list), new_inserted, duplicates_skipped)
+
+def _indexes_up_to_date(indexes):
+    """
+    Check an index_information() result against what setup_database_indexes builds.
+    
+    Args:
+        indexes (dict): Index name to index info, as returned by index_information()
+    
+    Returns:
+        bool: True if every index exists and no superseded one is left
+    """
+    expected = ('url_hash_1', 'url_1', 'url_type_1', 'search_query_1_url_type_1', 'created_at_1', 'icp_identifier_1')
+    return (
+        all(name in indexes for name in expected)
+        and indexes['url_hash_1'].get('unique', False)
+        and not indexes['url_1'].get('unique', False)
+        and 'search_query_text' not in indexes
+        and 'search_query_1' not in indexes
+    )
 
 def setup_database_indexes():
     """
     Create necessary database indexes for performance and data integrity.
+    
+    Skipped when the collection already has exactly the expected indexes.
     """
     try:
-        collection = get_collection()
+        db = get_database_connection()
+        collection = db[MONGODB_COLLECTION_NAME]
+        if _indexes_up_to_date(collection.index_information()):
+            print("Database indexes are up to date")
+            return
+        
+        # Backfill url_hash on documents saved before it existed
+        backfill = [
+            UpdateOne({'_id': doc['_id']}, {'$set': {'url_hash': url_hash(doc['url'])}})
+            for doc in collection.find({'url_hash': None, 'url': {'$exists': True}}, {'url': 1})
+        ]
+        if backfill:
+            print(f"Backfilling url_hash on {len(backfill)} existing URLs...")
+            collection.bulk_write(backfill, ordered=False)
         
-        # Create unique index on URL to prevent duplicates
-        print("Creating unique index on URL field...")
-        collection.create_index('url', unique=True)
+        # Create unique index on the fixed-size URL hash to prevent duplicates
+        print("Creating unique index on url_hash field...")
+        url_hash_unique = True
+        try:
+            collection.create_index('url_hash', unique=True)
+        except OperationFailure as e:
+            # Existing rows that differ only in host/scheme case collide after normalization
+            print(f"Warning: could not create unique url_hash index: {e}")
+            url_hash_unique = False
         
-        # Create index on search_query for faster queries
-        print("Creating index on search_query field...")
-        collection.create_index('search_query')
+        # Keep a plain index on URL for lookups by URL list; uniqueness moves to url_hash,
+        # so an older unique url index is only demoted once url_hash enforces it
+        if collection.index_information().get('url_1', {}).get('unique'):
+            if url_hash_unique:
+                collection.drop_index('url_1')
+                print("Creating index on URL field...")
+                collection.create_index('url')
+            else:
+                print("Keeping unique index on URL field until url_hash can be made unique")
+        else:
+            print("Creating index on URL field...")
+            collection.create_index('url')
         
-        # Create case-insensitive index for search_query
-        print("Creating case-insensitive index on search_query field...")
-        collection.create_index([('search_query', 'text')])
+        # Drop indexes that earlier versions created but that only slow inserts:
+        # - the text index was never used (queries match the lowercased search_query exactly)
+        # - the standalone search_query index duplicates the prefix of the compound index below
+        for index_name in ('search_query_text', 'search_query_1'):
+            try:
+                collection.drop_index(index_name)
+                print(f"Dropped redundant index: {index_name}")
+            except OperationFailure:
+                pass
         
         # Create index on url_type for faster filtering
         print("Creating index on url_type field...")
-        collection.create_index('url_type')
+        collection.create_index(URL_TYPE_INDEX)
         
         # Create compound index on search_query and url_type for combined queries
+        # (also serves search_query-only lookups as its prefix)
         print("Creating compound index on search_query and url_type...")
-        collection.create_index([('search_query', 1), ('url_type', 1)])
+        collection.create_index(QUERY_TYPE_INDEX)
         
         # Create index on created_at for time-based queries
         print("Creating index on created_at field...")
@@ -223,17 +585,22 @@ def get_database_stats():
     try:
         collection = get_collection()
         
-        total_documents = collection.count_documents({})
-        unique_queries = len(collection.distinct('search_query'))
+        # Total comes from collection metadata; the grouped counts share one round trip.
+        # Like distinct('search_query'), documents without a search_query are not a query
+        total_urls = collection.estimated_document_count()
+        pipeline = [{'$facet': {
+            'queries': [{'$match': {'search_query': {'$ne': None}}}, {'$group': {'_id': '$search_query'}}, {'$count': 'n'}],
+            'types': URL_TYPE_COUNT_PIPELINE
+        }}]
+        facets = next(collection.aggregate(pipeline))
         
-        # Get URL type statistics
-        url_type_stats = get_url_type_statistics()
+        url_type_breakdown = {result['_id']: result['count'] for result in facets['types']}
         
         return {
-            'total_urls': total_documents,
-            'unique_search_queries': unique_queries,
-            'url_type_breakdown': url_type_stats['url_types'],
-            'unique_url_types': url_type_stats['unique_url_types']
+            'total_urls': total_urls,
+            'unique_search_queries': facets['queries'][0]['n'] if facets['queries'] else 0,
+            'url_type_breakdown': url_type_breakdown,
+            'unique_url_types': len(url_type_breakdown)
         }
         
     except Exception as e:
@@ -253,9 +620,9 @@ def test_database_connection():
         bool: True if connection successful, False otherwise
     """
     try:
-        collection = get_collection()
-        # Try a simple operation
-        collection.find_one()
+        db = get_database_connection()
+        # Round trip to the server; the regular data paths skip this check
+        db.client.admin.command('ping')
         print("Database connection test successful!")
         return True
     except Exception as e:
@@ -269,18 +636,29 @@ def delete_urls_by_query(search_query):
     Args:
         search_query (str): The search query to match for deletion
     
+    Returns:
+        int: Number of documents deleted
+    """
+    return delete_urls_by_query_normalized(normalize_query(search_query))
+
+def delete_urls_by_query_normalized(search_query_lower):
+    """
+    Delete all URLs for a search query already passed through normalize_query.
+    
+    Args:
+        search_query_lower (str): Normalized search query
+    
     Returns:
         int: Number of documents deleted
     """
     try:
         collection = get_collection()
-        # Convert search query to lowercase for case-insensitive matching
-        search_query_lower = search_query.lower()
         result = collection.delete_many({'search_query': search_query_lower})
-        print(f"Deleted {result.deleted_count} URLs for query: '{search_query}' (matched as '{search_query_lower}')")
+        _forget_seen()
+        logger.debug("Deleted %d URLs for query: '%s'", result.deleted_count, search_query_lower)
         return result.deleted_count
     except Exception as e:
-        print(f"Error deleting URLs for query '{search_query}': {e}")
+        print(f"Error deleting URLs for query '{search_query_lower}': {e}")
         return 0
 
 def delete_url_by_url(url):
@@ -295,13 +673,10 @@ def delete_url_by_url(url):
     """
     try:
         collection = get_collection()
-        result = collection.delete_one({'url': url})
-        if result.deleted_count > 0:
-            print(f"Deleted URL: {url}")
-            return True
-        else:
-            print(f"URL not found for deletion: {url}")
-            return False
+        hashed_url = url_hash(url)
+        result = collection.delete_one({'url_hash': hashed_url})
+        _forget_seen(hashed_url)
+        return result.deleted_count > 0
     except Exception as e:
         print(f"Error deleting URL '{url}': {e}")
         return False
@@ -325,31 +700,44 @@ def delete_urls_by_date_range(start_date, end_date):
                 '$lte': end_date
             }
         })
-        print(f"Deleted {result.deleted_count} URLs between {start_date} and {end_date}")
+        _forget_seen()
+        logger.debug("Deleted %d URLs between %s and %s", result.deleted_count, start_date, end_date)
         return result.deleted_count
     except Exception as e:
         print(f"Error deleting URLs by date range: {e}")
         return 0
 
-def get_urls_by_query(search_query):
+def get_urls_by_query(search_query, fields=None):
     """
     Get all URLs that match a specific search query (case-insensitive).
     
     Args:
         search_query (str): The search query to match
+        fields (list): Optional field names to return; None returns whole documents
+    
+    Returns:
+        list: List of matching documents
+    """
+    return get_urls_by_query_normalized(normalize_query(search_query), fields)
+
+def get_urls_by_query_normalized(search_query_lower, fields=None):
+    """
+    Get all URLs for a search query already passed through normalize_query.
+    
+    Args:
+        search_query_lower (str): Normalized search query
+        fields (list): Optional field names to return; None returns whole documents
     
     Returns:
         list: List of matching documents
     """
     try:
         collection = get_collection()
-        # Convert search query to lowercase for case-insensitive matching
-        search_query_lower = search_query.lower()
-        results = list(collection.find({'search_query': search_query_lower}))
-        print(f"Found {len(results)} URLs for query: '{search_query}' (matched as '{search_query_lower}')")
+        results = list(collection.find({'search_query': search_query_lower}, projection=fields, batch_size=FIND_BATCH_SIZE))
+        logger.debug("Found %d URLs for query: '%s'", len(results), search_query_lower)
         return results
     except Exception as e:
-        print(f"Error getting URLs for query '{search_query}': {e}")
+        print(f"Error getting URLs for query '{search_query_lower}': {e}")
         return []
 
 def count_urls_by_query(search_query):
@@ -359,19 +747,49 @@ def count_urls_by_query(search_query):
     Args:
         search_query (str): The search query to match
     
+    Returns:
+        int: Number of matching documents
+    """
+    return count_urls_by_query_normalized(normalize_query(search_query))
+
+def count_urls_by_query_normalized(search_query_lower):
+    """
+    Count URLs for a search query already passed through normalize_query.
+    
+    Args:
+        search_query_lower (str): Normalized search query
+    
     Returns:
         int: Number of matching documents
     """
     try:
         collection = get_collection()
-        # Convert search query to lowercase for case-insensitive matching
-        search_query_lower = search_query.lower()
         count = collection.count_documents({'search_query': search_query_lower})
         return count
     except Exception as e:
-        print(f"Error counting URLs for query '{search_query}': {e}")
+        print(f"Error counting URLs for query '{search_query_lower}': {e}")
         return 0
 
+def get_url_type_breakdown_by_query(search_query):
+    """
+    Count stored URLs per URL type for a search query without fetching the documents.
+    
+    Args:
+        search_query (str): The search query to match
+    
+    Returns:
+        dict: Mapping of url_type to number of URLs
+    """
+    try:
+        collection = get_collection()
+        pipeline = [{'$match': {'search_query': normalize_query(search_query)}}] + URL_TYPE_COUNT_PIPELINE
+        # Covered by the (search_query, url_type) index: no documents are read
+        results = collection.aggregate(pipeline)
+        return {result['_id']: result['count'] for result in results}
+    except Exception as e:
+        print(f"Error getting URL type breakdown for query '{search_query}': {e}")
+        return {}
+
 def clear_all_urls():
     """
     Delete all URLs from the database (use with caution!).
@@ -382,32 +800,34 @@ def clear_all_urls():
     try:
         collection = get_collection()
         result = collection.delete_many({})
-        print(f"Deleted all {result.deleted_count} URLs from database")
+        _forget_seen()
+        logger.debug("Deleted all %d URLs from database", result.deleted_count)
         return result.deleted_count
     except Exception as e:
         print(f"Error clearing all URLs: {e}")
         return 0
 
-def get_urls_by_type(url_type):
+def get_urls_by_type(url_type, fields=None):
     """
     Get all URLs of a specific type.
     
     Args:
         url_type (str): The URL type to filter by ('instagram', 'facebook', 'reddit', 'quora', 'twitter', 'linkedin', 'general')
+        fields (list): Optional field names to return; None returns whole documents
     
     Returns:
         list: List of matching documents
     """
     try:
         collection = get_collection()
-        results = list(collection.find({'url_type': url_type}))
-        print(f"Found {len(results)} URLs of type: {url_type}")
+        results = list(collection.find({'url_type': url_type}, projection=fields, batch_size=FIND_BATCH_SIZE))
+        logger.debug("Found %d URLs of type: %s", len(results), url_type)
         return results
     except Exception as e:
         print(f"Error getting URLs by type '{url_type}': {e}")
         return []
 
-def get_urls_by_type_and_icp(url_type, icp_identifier, limit=100):
+def get_urls_by_type_and_icp(url_type, icp_identifier, limit=100, fields=None):
     """
     Get URLs by type and ICP identifier from the database.
     
@@ -415,6 +835,7 @@ def get_urls_by_type_and_icp(url_type, icp_identifier, limit=100):
         url_type (str): Type of URL to retrieve (general, instagram, linkedin, youtube, company_directory)
         icp_identifier (str): ICP identifier to filter by
         limit (int): Maximum number of URLs to return
+        fields (list): Optional field names to return; None returns whole documents
     
     Returns:
         list: List of URL documents
@@ -435,10 +856,10 @@ def get_urls_by_type_and_icp(url_type, icp_identifier, limit=100):
                 {'processed': False}  # Explicitly marked as unprocessed
             ]
         }
-        cursor = collection.find(query).limit(limit)
+        cursor = collection.find(query, projection=fields).limit(limit)
         
         urls = list(cursor)
-        print(f"Retrieved {len(urls)} URLs of type '{url_type}' for ICP '{icp_identifier}'")
+        logger.debug("Retrieved %d URLs of type '%s' for ICP '%s'", len(urls), url_type, icp_identifier)
         return urls
         
     except Exception as e:
@@ -473,48 +894,53 @@ def get_url_type_statistics():
     try:
         collection = get_collection()
         
-        # Get all unique URL types
-        url_types = collection.distinct('url_type')
-        
-        # Count each type
-        type_stats = {}
-        for url_type in url_types:
-            count = collection.count_documents({'url_type': url_type})
-            type_stats[url_type] = count
-        
-        # Get total count
-        total_urls = collection.count_documents({})
+        # Count every URL type server-side in one round trip
+        results = collection.aggregate(URL_TYPE_COUNT_PIPELINE)
+        type_stats = {result['_id']: result['count'] for result in results}
         
         return {
-            'total_urls': total_urls,
+            'total_urls': sum(type_stats.values()),
             'url_types': type_stats,
-            'unique_url_types': len(url_types)
+            'unique_url_types': len(type_stats)
         }
         
     except Exception as e:
         print(f"Error getting URL type statistics: {e}")
         return {'total_urls': 0, 'url_types': {}, 'unique_url_types': 0}
 
-def get_urls_by_query_and_type(search_query, url_type):
+def get_urls_by_query_and_type(search_query, url_type, fields=None):
     """
     Get URLs that match both a specific search query and URL type.
     
     Args:
         search_query (str): The search query to match
         url_type (str): The URL type to filter by
+        fields (list): Optional field names to return; None returns whole documents
+    
+    Returns:
+        list: List of matching documents
+    """
+    return get_urls_by_query_and_type_normalized(normalize_query(search_query), url_type, fields)
+
+def get_urls_by_query_and_type_normalized(search_query_lower, url_type, fields=None):
+    """
+    Get URLs of a given type for a search query already passed through normalize_query.
+    
+    Args:
+        search_query_lower (str): Normalized search query
+        url_type (str): The URL type to filter by
+        fields (list): Optional field names to return; None returns whole documents
     
     Returns:
         list: List of matching documents
     """
     try:
         collection = get_collection()
-        # Convert search query to lowercase for case-insensitive matching
-        search_query_lower = search_query.lower()
         results = list(collection.find({
             'search_query': search_query_lower,
             'url_type': url_type
-        }))
-        print(f"Found {len(results)} URLs for query '{search_query}' and type '{url_type}'")
+        }, projection=fields, batch_size=FIND_BATCH_SIZE))
+        logger.debug("Found %d URLs for query '%s' and type '%s'", len(results), search_query_lower, url_type)
         return results
     except Exception as e:
         print(f"Error getting URLs by query and type: {e}")
@@ -533,7 +959,8 @@ def delete_urls_by_type(url_type):
     try:
         collection = get_collection()
         result = collection.delete_many({'url_type': url_type})
-        print(f"Deleted {result.deleted_count} URLs of type: {url_type}")
+        _forget_seen()
+        logger.debug("Deleted %d URLs of type: %s", result.deleted_count, url_type)
         return result.deleted_count
     except Exception as e:
         print(f"Error deleting URLs by type '{url_type}': {e}")
@@ -562,7 +989,7 @@ def get_unprocessed_urls_by_type(url_type, limit=10):
         }
         
         results = list(collection.find(query).limit(limit))
-        print(f"Found {len(results)} unprocessed URLs of type: {url_type}")
+        logger.debug("Found %d unprocessed URLs of type: %s", len(results), url_type)
         return results
     except Exception as e:
         print(f"Error getting unprocessed URLs by type '{url_type}': {e}")
@@ -595,7 +1022,7 @@ def mark_urls_as_processed(urls):
             }
         )
         
-        print(f"Marked {result.modified_count} URLs as processed")
+        logger.debug("Marked %d URLs as processed", result.modified_count)
         return result.modified_count
     except Exception as e:
         print(f"Error marking URLs as processed: {e}")
@@ -628,7 +1055,7 @@ def get_urls_by_type_with_limit(url_type, limit=10, processed_only=False):
             ]]
         
         results = list(collection.find(query).limit(limit))
-        print(f"Found {len(results)} URLs of type: {url_type} (processed_only: {processed_only})")
+        logger.debug("Found %d URLs of type: %s (processed_only: %s)", len(results), url_type, processed_only)
         return results
     except Exception as e:
         print(f"Error getting URLs by type with limit '{url_type}': {e}")
@@ -662,4 +1089,91 @@ def get_available_url_counts():
         return counts
     except Exception as e:
         print(f"Error getting available URL counts: {e}")
-        return {} 
\ No newline at end of file
+        return {} 
+
+async def get_urls_by_type_async(url_type, fields=None):
+    """
+    Async version of get_urls_by_type that does not block the event loop.
+    
+    Args:
+        url_type (str): The URL type to filter by
+        fields (list): Optional field names to return; None returns whole documents
+    
+    Returns:
+        list: List of matching documents
+    """
+    if not MOTOR_AVAILABLE:
+        return await asyncio.to_thread(get_urls_by_type, url_type, fields)
+    
+    try:
+        collection = get_async_collection()
+        results = await collection.find({'url_type': url_type}, projection=fields, batch_size=FIND_BATCH_SIZE).to_list(None)
+        logger.debug("Found %d URLs of type: %s", len(results), url_type)
+        return results
+    except Exception as e:
+        print(f"Error getting URLs by type '{url_type}': {e}")
+        return []
+
+async def get_urls_by_type_and_icp_async(url_type, icp_identifier, limit=100, fields=None):
+    """
+    Async version of get_urls_by_type_and_icp that does not block the event loop.
+    
+    Args:
+        url_type (str): Type of URL to retrieve
+        icp_identifier (str): ICP identifier to filter by
+        limit (int): Maximum number of URLs to return
+        fields (list): Optional field names to return; None returns whole documents
+    
+    Returns:
+        list: List of URL documents
+    """
+    if not MOTOR_AVAILABLE:
+        return await asyncio.to_thread(get_urls_by_type_and_icp, url_type, icp_identifier, limit, fields)
+    
+    try:
+        if not url_type or not icp_identifier:
+            print("Error: url_type and icp_identifier are required")
+            return []
+        
+        collection = get_async_collection()
+        query = {
+            'url_type': url_type, 
+            'icp_identifier': icp_identifier,
+            '$or': [
+                {'processed': {'$exists': False}},
+                {'processed': False}
+            ]
+        }
+        urls = await collection.find(query, projection=fields).limit(limit).to_list(None)
+        logger.debug("Retrieved %d URLs of type '%s' for ICP '%s'", len(urls), url_type, icp_identifier)
+        return urls
+        
+    except Exception as e:
+        print(f"Error retrieving URLs by type and ICP: {e}")
+        return []
+
+async def get_url_type_statistics_async():
+    """
+    Async version of get_url_type_statistics that does not block the event loop.
+    
+    Returns:
+        dict: Statistics about URL types
+    """
+    if not MOTOR_AVAILABLE:
+        return await asyncio.to_thread(get_url_type_statistics)
+    
+    try:
+        collection = get_async_collection()
+        
+        results = await collection.aggregate(URL_TYPE_COUNT_PIPELINE).to_list(None)
+        type_stats = {result['_id']: result['count'] for result in results}
+        
+        return {
+            'total_urls': sum(type_stats.values()),
+            'url_types': type_stats,
+            'unique_url_types': len(type_stats)
+        }
+        
+    except Exception as e:
+        print(f"Error getting URL type statistics: {e}")
+        return {'total_urls': 0, 'url_types': {}, 'unique_url_types': 0}
@@ -1,7 +1,11 @@
+import atexit
+import functools
 import requests
-import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web_url_scraper.config import (
     GOOGLE_API_KEY, 
     GOOGLE_SEARCH_ENGINE_ID, 
@@ -9,6 +13,28 @@ from web_url_scraper.config import (
     RESULTS_PER_PAGE
 )
 
+# One keep-alive session for every query and page, so concurrent searches reuse
+# pooled TLS connections to the Custom Search API instead of reconnecting
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    # Add User-Agent header to avoid blocking
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    # After the last retry the response is returned, so API errors are still reported below
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+))
+
+def close_session():
+    """
+    Close the pooled HTTP connections used for Google searches.
+    """
+    _SESSION.close()
+
+atexit.register(close_session)
+
 def search_google(query, start_index=1):
     """
     Search Google using Custom Search API and return results.
@@ -33,18 +59,12 @@ def search_google(query, start_index=1):
             'num': RESULTS_PER_PAGE
         }
         
-        # Add User-Agent header to avoid blocking
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
         print(f"Searching Google for: {query} (start: {start_index})")
         
-        # Make HTTP request
-        response = requests.get(
+        # Make HTTP request over the shared session
+        response = _SESSION.get(
             base_url, 
             params=params, 
-            headers=headers, 
             timeout=30
         )
         
@@ -92,34 +112,23 @@ def search_multiple_pages(query, max_pages=MAX_PAGES):
     Returns:
         list: Combined list of all results from all pages
     """
-    all_results = []
-    current_page = 1
-    start_index = 1
-    
     print(f"Starting multi-page search for: {query} (max pages: {max_pages})")
     
-    while current_page <= max_pages:
-        print(f"Processing page {current_page}...")
-        
-        # Search current page
-        page_results = search_google(query, start_index)
-        
-        # If no results, break the loop
+    # Page start indexes are known up front (1, 11, 21, ...), so fetch them concurrently
+    start_indexes = [(page * RESULTS_PER_PAGE) + 1 for page in range(max_pages)]
+    if not start_indexes:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=len(start_indexes)) as executor:
+        pages = list(executor.map(lambda start_index: search_google(query, start_index), start_indexes))
+    
+    # Merge in page order, stopping at the first page without results
+    all_results = []
+    for current_page, page_results in enumerate(pages, start=1):
         if not page_results:
             print(f"No more results found on page {current_page}")
             break
-        
-        # Add results to collection
         all_results.extend(page_results)
-        
-        # Calculate next start index
-        start_index = (current_page * RESULTS_PER_PAGE) + 1
-        current_page += 1
-        
-        # Add delay between requests to be respectful
-        if current_page <= max_pages:
-            print("Waiting 1 second before next request...")
-            time.sleep(2)
     
     print(f"Total results found: {len(all_results)}")
     return all_results
@@ -156,6 +165,45 @@ def is_valid_url(url):
     
     return bool(url_pattern.match(url))
 
+# Domains for each social URL type; a URL matches on the domain itself or any subdomain
+SOCIAL_DOMAINS = {
+    'instagram': ('instagram.com',),
+    'facebook': ('facebook.com',),
+    'reddit': ('reddit.com',),
+    'quora': ('quora.com',),
+    'twitter': ('twitter.com', 'x.com'),
+    'linkedin': ('linkedin.com',),
+    'youtube': ('youtube.com',),
+}
+
+# Company directory domains, matched anywhere in the host
+COMPANY_DIRECTORY_DOMAINS = (
+    'thomasnet.com', 'indiamart.com', 'kompass.com', 'yellowpages.com',
+    'yelp.com', 'crunchbase.com', 'opencorporates.com', 'manta.com',
+    'dexknows.com', 'superpages.com', 'bizdir.com', 'businessdirectory.com',
+    'local.com', 'bbb.org', 'angieslist.com', 'houzz.com', 'thumbtack.com',
+    'homeadvisor.com', 'angi.com', 'cylex.net', 'tuugo.us', 'hotfrog.com',
+    'brownbook.net', 'citysearch.com', 'insiderpages.com', 'showmelocal.com',
+    'getthedata.co', 'companycheck.co.uk', 'duedil.com', 'thesunbusinessdirectory.com',
+    'yell.com', 'touchlocal.com', 'cylex-uk.co.uk', 'ukindex.co.uk',
+    'findopen.co.uk', 'thesun.co.uk', 'scotsman.com', 'telegraph.co.uk',
+    'independent.co.uk'
+)
+
+def _domain_alternation(domains):
+    return '|'.join(re.escape(domain) for domain in domains)
+
+# Every URL type in one alternation, so a host is classified in a single regex pass;
+# the name of the matching group is the URL type. Each branch is anchored at the start
+# of the host and used with match(), so branches are tried in order and social types
+# win over directory domains that appear earlier in the host
+_URL_TYPE_PATTERN = re.compile('|'.join(
+    [f'(?P<{url_type}>(?:.*\\.)?(?:{_domain_alternation(domains)})$)' for url_type, domains in SOCIAL_DOMAINS.items()]
+    + [f'(?P<company_directory>.*(?:{_domain_alternation(COMPANY_DIRECTORY_DOMAINS)}))']
+))
+
+# Pure function of the URL string; search pages often repeat URLs across queries
+@functools.lru_cache(maxsize=8192)
 def detect_url_type(url):
     """
     Detect the type of URL based on the domain.
@@ -171,70 +219,44 @@ def detect_url_type(url):
     
     try:
         # Parse the URL to get the domain
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.lower()
-        
-        # Remove 'www.' prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
+        domain = urlparse(url).netloc.lower()
         
-        # Check for exact domain matches or subdomains
-        if domain == 'instagram.com' or domain.endswith('.instagram.com'):
-            return 'instagram'
-        elif domain == 'facebook.com' or domain.endswith('.facebook.com'):
-            return 'facebook'
-        elif domain == 'reddit.com' or domain.endswith('.reddit.com'):
-            return 'reddit'
-        elif domain == 'quora.com' or domain.endswith('.quora.com'):
-            return 'quora'
-        elif domain == 'twitter.com' or domain.endswith('.twitter.com') or domain == 'x.com' or domain.endswith('.x.com'):
-            return 'twitter'
-        elif domain == 'linkedin.com' or domain.endswith('.linkedin.com'):
-            return 'linkedin'
-        elif domain == 'youtube.com' or domain.endswith('.youtube.com'):
-            return 'youtube'
-        # Company directory domains
-        elif any(cd_domain in domain for cd_domain in [
-            'thomasnet.com', 'indiamart.com', 'kompass.com', 'yellowpages.com',
-            'yelp.com', 'crunchbase.com', 'opencorporates.com', 'manta.com',
-            'dexknows.com', 'superpages.com', 'bizdir.com', 'businessdirectory.com',
-            'local.com', 'bbb.org', 'angieslist.com', 'houzz.com', 'thumbtack.com',
-            'homeadvisor.com', 'angi.com', 'cylex.net', 'tuugo.us', 'hotfrog.com',
-            'brownbook.net', 'citysearch.com', 'insiderpages.com', 'showmelocal.com',
-            'getthedata.co', 'companycheck.co.uk', 'duedil.com', 'thesunbusinessdirectory.com',
-            'yell.com', 'touchlocal.com', 'cylex-uk.co.uk', 'ukindex.co.uk',
-            'findopen.co.uk', 'thesun.co.uk', 'scotsman.com', 'telegraph.co.uk',
-            'independent.co.uk'
-        ]):
-            return 'company_directory'
-        else:
-            return 'general'
+        match = _URL_TYPE_PATTERN.match(domain)
+        return match.lastgroup if match else 'general'
             
     except Exception as e:
         print(f"Error detecting URL type for {url}: {e}")
         return 'general'
 
-def filter_valid_urls(urls_list):
+def iter_valid_urls(urls_list):
     """
-    Filter a list of URL dictionaries to only include valid URLs and add URL type.
+    Lazily yield the valid URL dictionaries with their url_type added.
     
     Args:
-        urls_list (list): List of URL dictionaries
+        urls_list (iterable): URL dictionaries
     
-    Returns:
-        list: Filtered list with only valid URLs and added url_type field
+    Yields:
+        dict: Valid URL dictionary with url_type field
     """
-    valid_urls = []
-    invalid_count = 0
-    
     for url_data in urls_list:
         url = url_data.get('url', '')
         if is_valid_url(url):
             # Add URL type to the data
             url_data['url_type'] = detect_url_type(url)
-            valid_urls.append(url_data)
-        else:
-            invalid_count += 1
+            yield url_data
+
+def filter_valid_urls(urls_list):
+    """
+    Filter a list of URL dictionaries to only include valid URLs and add URL type.
+    
+    Args:
+        urls_list (list): List of URL dictionaries
+    
+    Returns:
+        list: Filtered list with only valid URLs and added url_type field
+    """
+    valid_urls = list(iter_valid_urls(urls_list))
+    invalid_count = len(urls_list) - len(valid_urls)
     
     if invalid_count > 0:
         print(f"Filtered out {invalid_count} invalid URLs")
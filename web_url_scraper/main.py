@@ -1,50 +1,122 @@
+import argparse
+import asyncio
+import io
 import sys
+from collections import Counter
 
 from web_url_scraper.config import validate_config, get_config_summary 
 from web_url_scraper.google_service import search_multiple_pages, filter_valid_urls, detect_url_type
-from web_url_scraper.database_service import test_database_connection, setup_database_indexes, save_multiple_urls, initialize_database, get_urls_by_query, get_database_stats
+from web_url_scraper.database_service import test_database_connection, setup_database_indexes, save_multiple_urls, save_multiple_urls_async, initialize_database, count_urls_by_query, get_url_type_breakdown_by_query, get_database_stats
 
-def main(search_query, icp_identifier='default'):
+def prepare_search(search_query):
+    """
+    Validate the query, run the Google search and keep only valid URLs.
+    
+    Args:
+        search_query (str): The search query to process
+    
+    Returns:
+        tuple: (cleaned query, all search results, valid URLs), or None if there is nothing to store
+    """
+    # Input validation
+    if not search_query or len(search_query.strip()) == 0:
+        print("Error: Search query cannot be empty")
+        return None
+    
+    if len(search_query) > 200:
+        print("Error: Search query is too long (max 200 characters)")
+        return None
+    
+    # Clean search query
+    search_query = search_query.strip()
+    print(f"Starting search for: {search_query}")
+    
+    # Search execution: get list of url data dictionaries {url, title, snippet}
+    print("Executing Google search...")
+    all_results = search_multiple_pages(search_query)
+    
+    if not all_results:
+        print("No search results found")
+        return None
+    
+    print(f"Found {len(all_results)} total URLs")
+    
+    # URL processing - filter valid URLs
+    print("Filtering valid URLs...")
+    valid_urls = filter_valid_urls(all_results)
+    
+    if not valid_urls:
+        print("No valid URLs found after filtering")
+        return None
+    
+    print(f"Valid URLs to process: {len(valid_urls)}")
+    return search_query, all_results, valid_urls
+
+def print_search_summary(search_query, all_results, valid_urls, stats):
+    """
+    Print the results summary for a completed search.
+    
+    Args:
+        search_query (str): The processed search query
+        all_results (list): All search results
+        valid_urls (list): URLs that passed filtering
+        stats (dict): Storage statistics from save_multiple_urls
+    """
+    # Get URL type breakdown for the current search
+    url_type_breakdown = Counter(url_data.get('url_type', 'general') for url_data in valid_urls)
+    
+    # Results summary, written in one call so concurrent searches don't interleave lines
+    lines = [
+        "\n" + "="*50,
+        "SEARCH COMPLETED SUCCESSFULLY",
+        "="*50,
+        f"Search Query: {search_query}",
+        f"Total URLs Found: {len(all_results)}",
+        f"Valid URLs: {len(valid_urls)}",
+        f"New URLs Added: {stats['new_inserted']}",
+        f"Duplicates Skipped: {stats['duplicates_skipped']}",
+    ]
+    
+    # Display URL type breakdown
+    if url_type_breakdown:
+        lines.append("\nURL Type Breakdown:")
+        lines.extend(f"  {url_type.capitalize()}: {count}" for url_type, count in url_type_breakdown.items())
+    
+    lines.append("="*50)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def verify_stored_urls(search_query):
+    """
+    Read back how many URLs the database holds for a query, without fetching them.
+    
+    Only reports: URLs already stored under another query are skipped as duplicates
+    and counted there, so a zero count here does not mean the save failed.
+    
+    Args:
+        search_query (str): The processed search query
+    """
+    stored_count = count_urls_by_query(search_query)
+    lines = [f"Verification: {stored_count} URLs stored for '{search_query}'"]
+    lines.extend(
+        f"  {url_type.capitalize()}: {count}"
+        for url_type, count in sorted(get_url_type_breakdown_by_query(search_query).items())
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def main(search_query, icp_identifier='default', verify=False):
     """
     Main execution function for the Google URL scraper.
     
     Args:
         search_query (str): The search query to process
         icp_identifier (str): ICP identifier for tracking
+        verify (bool): Read back the stored URL counts after saving
     """
     try:
-        # Input validation
-        if not search_query or len(search_query.strip()) == 0:
-            print("Error: Search query cannot be empty")
-            return False
-        
-        if len(search_query) > 200:
-            print("Error: Search query is too long (max 200 characters)")
-            return False
-        
-        # Clean search query
-        search_query = search_query.strip()
-        print(f"Starting search for: {search_query}")
-        
-        # Search execution: get list of url data dictionaries {url, title, snippet}
-        print("Executing Google search...")
-        all_results = search_multiple_pages(search_query)
-        
-        if not all_results:
-            print("No search results found")
+        prepared = prepare_search(search_query)
+        if not prepared:
             return False
-        
-        print(f"Found {len(all_results)} total URLs")
-        
-        # URL processing - filter valid URLs
-        print("Filtering valid URLs...")
-        valid_urls = filter_valid_urls(all_results)
-        
-        if not valid_urls:
-            print("No valid URLs found after filtering")
-            return False
-        
-        print(f"Valid URLs to process: {len(valid_urls)}")
+        search_query, all_results, valid_urls = prepared
         
         # Database storage
         # Initialize ONCE at the start of your application
@@ -53,29 +125,11 @@ def main(search_query, icp_identifier='default'):
         print("Saving URLs to database...")
         stats = save_multiple_urls(valid_urls, search_query, icp_identifier)
         
-        # Get URL type breakdown for the current search
-        url_type_breakdown = {}
-        for url_data in valid_urls:
-            url_type = url_data.get('url_type', 'general')
-            url_type_breakdown[url_type] = url_type_breakdown.get(url_type, 0) + 1
-        
-        # Results summary
-        print("\n" + "="*50)
-        print("SEARCH COMPLETED SUCCESSFULLY")
-        print("="*50)
-        print(f"Search Query: {search_query}")
-        print(f"Total URLs Found: {len(all_results)}")
-        print(f"Valid URLs: {len(valid_urls)}")
-        print(f"New URLs Added: {stats['new_inserted']}")
-        print(f"Duplicates Skipped: {stats['duplicates_skipped']}")
-        
-        # Display URL type breakdown
-        if url_type_breakdown:
-            print("\nURL Type Breakdown:")
-            for url_type, count in url_type_breakdown.items():
-                print(f"  {url_type.capitalize()}: {count}")
-        
-        print("="*50)
+        print_search_summary(search_query, all_results, valid_urls, stats)
+        
+        # The storage statistics already report what was written; reading back is opt-in
+        if verify:
+            verify_stored_urls(search_query)
         
         return True
         
@@ -86,6 +140,34 @@ def main(search_query, icp_identifier='default'):
         print(f"Unexpected error: {e}")
         return False
 
+async def main_async(search_query, icp_identifier='default'):
+    """
+    Async version of main for asyncio callers: the Google search runs in a worker
+    thread and the URLs are stored without blocking the event loop.
+    
+    Args:
+        search_query (str): The search query to process
+        icp_identifier (str): ICP identifier for tracking
+    """
+    try:
+        prepared = await asyncio.to_thread(prepare_search, search_query)
+        if not prepared:
+            return False
+        search_query, all_results, valid_urls = prepared
+        
+        await asyncio.to_thread(initialize_database)
+        print("Database ready!")
+        print("Saving URLs to database...")
+        stats = await save_multiple_urls_async(valid_urls, search_query, icp_identifier)
+        
+        print_search_summary(search_query, all_results, valid_urls, stats)
+        
+        return True
+        
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return False
+
 def initialize_application():
     """
     Initialize the application by validating configuration and testing connections.
@@ -111,24 +193,28 @@ def initialize_application():
     print("\nSetting up database indexes...")
     setup_database_indexes()
     
+    report = io.StringIO()
+    
     # Show configuration summary
-    print("\nConfiguration Summary:")
+    print("\nConfiguration Summary:", file=report)
     config_summary = get_config_summary()
     for key, value in config_summary.items():
         if 'key' not in key.lower() and 'id' not in key.lower():
-            print(f"  {key}: {value}")
+            print(f"  {key}: {value}", file=report)
     
     # Show database statistics
-    print("\nDatabase Statistics:")
+    print("\nDatabase Statistics:", file=report)
     db_stats = get_database_stats()
-    print(f"  Total URLs: {db_stats['total_urls']}")
-    print(f"  Unique Search Queries: {db_stats['unique_search_queries']}")
-    print(f"  Unique URL Types: {db_stats['unique_url_types']}")
+    print(f"  Total URLs: {db_stats['total_urls']}", file=report)
+    print(f"  Unique Search Queries: {db_stats['unique_search_queries']}", file=report)
+    print(f"  Unique URL Types: {db_stats['unique_url_types']}", file=report)
     
     if db_stats['url_type_breakdown']:
-        print("  URL Type Breakdown:")
+        print("  URL Type Breakdown:", file=report)
         for url_type, count in db_stats['url_type_breakdown'].items():
-            print(f"    {url_type.capitalize()}: {count}")
+            print(f"    {url_type.capitalize()}: {count}", file=report)
+    
+    sys.stdout.write(report.getvalue())
     
     print("\nApplication initialized successfully!")
     return True
@@ -137,84 +223,124 @@ def display_database_statistics():
     """
     Display comprehensive database statistics including URL type breakdown.
     """
-    print("\n" + "="*50)
-    print("DATABASE STATISTICS")
-    print("="*50)
+    report = io.StringIO()
+    print("\n" + "="*50, file=report)
+    print("DATABASE STATISTICS", file=report)
+    print("="*50, file=report)
     
     try:
         stats = get_database_stats()
+        total_urls = stats['total_urls']
         
-        print(f"Total URLs: {stats['total_urls']}")
-        print(f"Unique Search Queries: {stats['unique_search_queries']}")
-        print(f"Unique URL Types: {stats['unique_url_types']}")
+        print(f"Total URLs: {total_urls}", file=report)
+        print(f"Unique Search Queries: {stats['unique_search_queries']}", file=report)
+        print(f"Unique URL Types: {stats['unique_url_types']}", file=report)
         
         if stats['url_type_breakdown']:
-            print("\nURL Type Breakdown:")
+            print("\nURL Type Breakdown:", file=report)
+            percent_per_url = 100.0 / total_urls if total_urls > 0 else 0.0
             for url_type, count in sorted(stats['url_type_breakdown'].items()):
-                percentage = (count / stats['total_urls'] * 100) if stats['total_urls'] > 0 else 0
-                print(f"  {url_type.capitalize()}: {count} ({percentage:.1f}%)")
+                print(f"  {url_type.capitalize()}: {count} ({count * percent_per_url:.1f}%)", file=report)
         else:
-            print("\nNo URLs found in database.")
+            print("\nNo URLs found in database.", file=report)
             
     except Exception as e:
-        print(f"Error getting database statistics: {e}")
+        print(f"Error getting database statistics: {e}", file=report)
+    
+    print("="*50, file=report)
+    
+    # One write per report instead of one per line
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
+
+def parse_arguments(argv=None):
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv (list): Arguments to parse (defaults to sys.argv[1:])
     
-    print("="*50)
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Google URL Scraper")
+    parser.add_argument('query', nargs='*', help="Search query to run (words are joined)")
+    parser.add_argument('--icp', default='default', help="ICP identifier stored with the URLs")
+    parser.add_argument('--stats', action='store_true', help="Show database statistics and exit")
+    parser.add_argument('--verify', action='store_true', help="Read back stored URL counts after saving")
+    parser.add_argument('--interactive', action='store_true', help="Use the interactive menu")
+    return parser.parse_args(argv)
 
-def run_command_line_interface():
+def run_interactive_menu():
+    """
+    Prompt for searches and statistics until the user exits.
+    """
+    while True:
+        print("\nGoogle URL Scraper")
+        print("=" * 30)
+        print("1. Search for URLs")
+        print("2. View Database Statistics")
+        print("3. Exit")
+        
+        choice = input("\nSelect an option (1-3): ").strip()
+        
+        if choice == '1':
+            search_query = input("Enter search query: ").strip()
+            
+            if not search_query:
+                print("No search query provided. Please try again.")
+                continue
+            
+            # Run the main application
+            success = main(search_query)
+            
+            if success:
+                print("\nOperation completed successfully!")
+            else:
+                print("\nOperation failed. Please check the error messages above.")
+                
+        elif choice == '2':
+            display_database_statistics()
+            
+        elif choice == '3':
+            print("Exiting application...")
+            break
+            
+        else:
+            print("Invalid option. Please select 1, 2, or 3.")
+
+def run_command_line_interface(args):
     """
     Handle command line interface and user input.
+    
+    Without a query or --stats, the interactive menu is only used when requested
+    or when stdin is a terminal, so scripted runs never block on input().
+    
+    Args:
+        args (argparse.Namespace): Arguments from parse_arguments
     """
-    # Check if search query provided as command line argument
-    if len(sys.argv) > 1:
-        search_query = ' '.join(sys.argv[1:])
+    if args.query:
+        search_query = ' '.join(args.query)
         print(f"Using search query from command line: {search_query}")
         
         # Run the main application
-        success = main(search_query)
+        success = main(search_query, args.icp, verify=args.verify)
         
         if success:
             print("\nOperation completed successfully!")
         else:
             print("\nOperation failed. Please check the error messages above.")
             sys.exit(1)
+    elif args.stats:
+        display_database_statistics()
+    elif args.interactive or sys.stdin.isatty():
+        run_interactive_menu()
     else:
-        # Interactive mode
-        while True:
-            print("\nGoogle URL Scraper")
-            print("=" * 30)
-            print("1. Search for URLs")
-            print("2. View Database Statistics")
-            print("3. Exit")
-            
-            choice = input("\nSelect an option (1-3): ").strip()
-            
-            if choice == '1':
-                search_query = input("Enter search query: ").strip()
-                
-                if not search_query:
-                    print("No search query provided. Please try again.")
-                    continue
-                
-                # Run the main application
-                success = main(search_query)
-                
-                if success:
-                    print("\nOperation completed successfully!")
-                else:
-                    print("\nOperation failed. Please check the error messages above.")
-                    
-            elif choice == '2':
-                display_database_statistics()
-                
-            elif choice == '3':
-                print("Exiting application...")
-                break
-                
-            else:
-                print("Invalid option. Please select 1, 2, or 3.")
+        print("No search query provided. Pass a query, --stats or --interactive.")
+        sys.exit(2)
 
 if __name__ == "__main__":
+    cli_args = parse_arguments()
     try:
         # Initialize application
         if not initialize_application():
@@ -222,7 +348,7 @@ if __name__ == "__main__":
             sys.exit(1)
         
         # Run command line interface
-        run_command_line_interface()
+        run_command_line_interface(cli_args)
         
     except KeyboardInterrupt:
         print("\nApplication interrupted by user. Exiting.")